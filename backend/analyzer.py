@@ -1,74 +1,218 @@
 # backend/analyzer.py
 import os
+import re
 import json
+import pickle
+import sqlite3
 import hashlib
 import textstat
-import xml.etree.ElementTree as ET
-
-from backend.fetcher import fetch_full_title_xml, fetch_agencies, fetch_titles_summary
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# lxml's parser runs in C and is several times faster on these files, but the stdlib parser is
+# a workable zero-dependency fallback (see _iter_div3 for the per-parser memory handling)
+try:
+    import lxml.etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+
+# orjson decodes several times faster than stdlib json; fall back silently if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Title xml may be stored zstd-compressed (see fetcher); decompress streamingly when so
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+from backend.fetcher import fetch_full_title_xml, fetch_titles, fetch_agencies, fetch_titles_summary
 
 DATA_FOLDER = "backend/data"
 
-# Processes a raw XML document located in file_path and (when return_sections is True) returns a dict where
+# Yields each completed top-level DIV3 element from an iterparse over source, clearing handled
+# nodes as it goes so memory stays bounded (eCFR title XML runs to tens of MB, so we cannot
+# afford to keep the whole tree around). With lxml the parser itself skips non-DIV3 tags and
+# preceding siblings are deleted; the stdlib fallback tracks DIV3 nesting by hand and clears
+# everything that ends outside a chapter subtree
+def _iter_div3(source):
+    if _HAVE_LXML:
+        for _, elem in ET.iterparse(source, events=("end",), tag="DIV3"):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+
+    div3_depth = 0
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "DIV3":
+                div3_depth += 1
+            continue
+        if elem.tag == "DIV3":
+            div3_depth -= 1
+            if div3_depth == 0:
+                yield elem
+                elem.clear()
+        elif div3_depth == 0:
+            elem.clear()
+
+# Location of the parsed-text sidecar cache next to a title xml file
+def _cache_path(file_path):
+    return file_path + ".sections.pkl"
+
+# Resolves the on-disk file for a (title, date), preferring the compressed .xml.zst form the
+# fetcher writes over a plain .xml (the returned path may not exist yet if neither does)
+def _title_xml_path(DATA_FOLDER, title_num, date):
+    base = os.path.join(DATA_FOLDER, f"title_{title_num}_{date}.xml")
+    if os.path.exists(base + ".zst"):
+        return base + ".zst"
+    return base
+
+# Opens a title xml file for parsing, stream-decompressing .zst files so the parser never sees
+# (and the disk never serves) the uncompressed 10-100 MB form
+def _open_xml(file_path):
+    if file_path.endswith(".zst"):
+        if zstd is None:
+            raise RuntimeError(f"{file_path} is zstd-compressed but the zstandard module is not installed")
+        return zstd.ZstdDecompressor().stream_reader(open(file_path, "rb"))
+    return open(file_path, "rb")
+
+# Parses every chapter of a title xml once and returns a dict where
+#   keys = chapter number (ex. "II"), uppercased
+#   values = {"heading": chapter heading, "text": full text from that chapter}
+# Streams the document through _iter_div3 so the whole tree is never resident at once
+def _parse_all_chapters(file_path):
+    chapters = {}
+    with _open_xml(file_path) as source:
+        for chapter_elem in _iter_div3(source):
+            if chapter_elem.get("TYPE") == "CHAPTER":
+                chapter_number = chapter_elem.get("N", "").upper()
+                heading_elem = chapter_elem.find("HEAD")
+                heading = heading_elem.text.strip() if heading_elem is not None else f"Chapter {chapter_number}"
+
+                # itertext() walks the subtree without a Python loop over every node
+                text = " ".join(s.strip() for s in chapter_elem.itertext() if s and s.strip())
+                chapters[chapter_number] = {"heading": heading, "text": text}
+    return chapters
+
+# Returns the cached chapter dict for file_path, reparsing (and rewriting the cache) only when
+# the xml file is newer than its sidecar .sections.pkl
+def _load_chapters(file_path):
+    cache_file = _cache_path(file_path)
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(file_path):
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            print(f"    Could not read cache {cache_file}, reparsing") #debug
+
+    chapters = _parse_all_chapters(file_path)
+    try:
+        with open(cache_file, "wb") as f:
+            pickle.dump(chapters, f)
+    except OSError:
+        print(f"    Could not write cache {cache_file}") #debug
+    return chapters
+
+# Processes a raw XML document located in file_path and returns a dict where
 #   keys = chapter headings (ex. Chapter II-Department of Agrictulture)
 #   values = full text from that chapter
+# The xml is parsed at most once per (title, date); the full chapter dict is cached on disk and
+# the requested chapters are sliced out of the cached dict on repeat calls. Callers that want
+# one flat string join the values themselves
 # Params:
 #   file_path (str) path to the xml file (ex. backend/data/title_2_2024-07-01.xml)
 #   target_chapters (list[str] or None) optional list of chapter numbers to extract
-#   return_sections (bool) if True returns a full keyed dict, otherwise returns a str
-def parse_title_xml(file_path, target_chapters=None, return_sections=False):
-    tree = ET.parse(file_path)
-    root = tree.getroot()
-
-    # If no sections, just return as one chunk
-    if not return_sections:
-        text_blocks = []
-
-        # If no filtering, gather all text in document (for analysis)
-        if not target_chapters:
-            for elem in root.iter():
-                if elem.text and elem.text.strip():
-                    text_blocks.append(elem.text.strip())
-            return " ".join(text_blocks)
-
-        for chapter_elem in root.findall(".//DIV3[@TYPE='CHAPTER']"):
-            chapter_number = chapter_elem.attrib.get("N", "").upper()
-            if any(chap and chap.upper() == chapter_number for chap in target_chapters):
-                for elem in chapter_elem.iter():
-                    if elem.text and elem.text.strip():
-                        text_blocks.append(elem.text.strip())
-        return " ".join(text_blocks)
-
-    # Dict output for chapters separated into sections (for displaying in ui)
+def parse_title_xml(file_path, target_chapters=None):
+    chapters = _load_chapters(file_path)
+
+    if target_chapters:
+        # Normalize the requested chapters once so membership is a single O(1) set probe per
+        # chapter instead of an upper-casing scan of the target list
+        wanted = frozenset(chap.upper() for chap in target_chapters if chap)
+        selected = {num: info for num, info in chapters.items() if num in wanted}
     else:
-        chapter_texts = {}
-        for chapter_elem in root.findall(".//DIV3[@TYPE='CHAPTER']"):
-            chapter_number = chapter_elem.attrib.get("N", "").upper()
-            if (not target_chapters) or any(chap and chap.upper() == chapter_number for chap in target_chapters):
-                heading_elem = chapter_elem.find("HEAD")
-                heading = heading_elem.text.strip() if heading_elem is not None else f"Chapter {chapter_number}"
-                text_blocks = []
+        selected = chapters
+
+    return {info["heading"]: info["text"] for info in selected.values()}
 
-                for elem in chapter_elem.iter():
-                    if elem.text and elem.text.strip():
-                        text_blocks.append(elem.text.strip())
-                chapter_texts[heading] = " ".join(text_blocks)
-        return chapter_texts
+# Whitespace-delimited tokens, same definition as str.split()
+_TOKEN_RE = re.compile(r"\S+")
 
-# Simple word count
+# Simple word count. finditer counts matches without materializing a list of every token the
+# way text.split() does, which matters on multi-MB chapter texts
 def compute_word_count(text):
-    return len(text.split())
+    return sum(1 for _ in _TOKEN_RE.finditer(text))
 
 # Computes a SHA-256 checksum of the full regulatory text.
 def compute_checksum(text):
     return hashlib.sha256(text.encode('utf-8')).hexdigest()
 
+# Tokenizers for the Flesch-Kincaid computation, compiled once at import
+_WORD_RE = re.compile(r"[A-Za-z]+")
+_SENT_RE = re.compile(r"[.!?]+")
+_VOWEL_GROUP_RE = re.compile(r"[aeiouy]+", re.IGNORECASE)
+
+# Approximates the syllable count of a word as its number of vowel groups (minimum one).
+# Cached because regulatory text reuses the same vocabulary constantly
+@lru_cache(maxsize=65536)
+def _count_syllables(word):
+    return max(1, len(_VOWEL_GROUP_RE.findall(word)))
+
 # Computes a complexity score for the text based on the Flesch-Kincaid Grade Level
-def compute_complexity(text):
-    try:
-        return textstat.flesch_kincaid_grade(text)
-    except:
+#   FKGL = 0.39 * (words/sentences) + 11.8 * (syllables/words) - 15.59
+# Computed directly with precompiled regexes (two C-level passes) instead of textstat, which
+# re-tokenizes the whole corpus in Python for each sub-metric. Pass exact=True to fall back to
+# textstat's implementation
+def compute_complexity(text, exact=False):
+    if exact:
+        try:
+            return textstat.flesch_kincaid_grade(text)
+        except:
+            return None
+
+    words = _WORD_RE.findall(text)
+    if not words:
         return None
+    n_words = len(words)
+    n_sentences = max(1, len(_SENT_RE.findall(text)))
+    n_syllables = sum(_count_syllables(word) for word in words)
+    return round(0.39 * (n_words / n_sentences) + 11.8 * (n_syllables / n_words) - 15.59, 2)
+
+# Flesch-Kincaid is a ratio of ratios, so it converges on a modest representative sample;
+# scoring all 50 MB of a big agency buys nothing but syllable-counting time
+_COMPLEXITY_SAMPLE_CHARS = 200_000
+
+# Computes one title's metric block in a single pass over its text: exact word count, the
+# text's sha-256, and the word/sentence/syllable tallies behind Flesch-Kincaid (taken from at
+# most the first _COMPLEXITY_SAMPLE_CHARS characters). Every field sums cleanly across titles,
+# which is what lets analyze_agencies aggregate them and the sqlite cache reuse them
+# Returns:
+#   {"word_count": int, "text_sha": str, "n_words": int, "n_sentences": int,
+#    "n_syllables": int, "sampled": bool}
+def compute_title_stats(text):
+    sample = text if len(text) <= _COMPLEXITY_SAMPLE_CHARS else text[:_COMPLEXITY_SAMPLE_CHARS]
+    n_words = 0
+    n_syllables = 0
+    for word in _WORD_RE.findall(sample):
+        n_words += 1
+        n_syllables += _count_syllables(word)
+
+    return {
+        "word_count": compute_word_count(text),
+        "text_sha": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+        "n_words": n_words,
+        "n_sentences": len(_SENT_RE.findall(sample)),
+        "n_syllables": n_syllables,
+        "sampled": len(text) > _COMPLEXITY_SAMPLE_CHARS
+    }
 
 # Performs three analysis on a provided xml file
 # Outdated, left in to show why parse_title_xml has optional params
@@ -80,6 +224,16 @@ def compute_complexity(text):
 #        "complexity": compute_complexity(text)
 #    }
 
+# mtime-keyed parse cache: the same agencies.json (several hundred KB) backs every api request,
+# so keep the decoded dict in process and only re-read when the file changes on disk
+@lru_cache(maxsize=8)
+def _load_json_cached(file_path, mtime):
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # Loads a json file from file_path and if the file does not exist it attempts to fetch it
 def load_json(file_path):
     if not os.path.exists(file_path):
@@ -95,27 +249,48 @@ def load_json(file_path):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Failed to fetch required file: {file_path}")
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_cached(file_path, os.path.getmtime(file_path))
 
 # Builds a dict with agencies_data where
 #   keys = agency name
-#   values = a nested dict with titles -> chapters list and name -> agency name
+#   values = a nested dict with titles -> titles list, name -> agency name, and
+#            chapters_by_title -> {title number: [chapter numbers]}
+# The chapters_by_title index is built here, in one pass over cfr_references, so callers can
+# look up an agency's chapters for a title in O(1) instead of rescanning every agency per title
 def build_agency_title_map(agencies_data):
     agency_map = {}
     # Flatten agencies with IDs and names (recursively for children)
     for agency in agencies_data.get("agencies", []):
         name = agency.get("name") # or agency.get("display_name")
-        titles = [ref["title"] for ref in agency.get("cfr_references") if "title" in ref]
+        titles = []
+        chapters_by_title = {}
+        for ref in agency.get("cfr_references", []):
+            if "title" not in ref:
+                continue
+            titles.append(ref["title"])
+            if ref.get("chapter") is not None:
+                chapters_by_title.setdefault(ref["title"], []).append(ref["chapter"])
 
         if titles:
             agency_map[name] = {
                 "titles": titles,
-                "name": name
+                "name": name,
+                "chapters_by_title": chapters_by_title
             }
 
     return agency_map
 
+# Derived-map twin of _load_json_cached: the agency map only changes when agencies.json does,
+# so cache it under the same (path, mtime) key
+@lru_cache(maxsize=8)
+def _agency_map_cached(file_path, mtime):
+    return build_agency_title_map(_load_json_cached(file_path, mtime))
+
+# Returns the agency title map for the agencies.json at file_path, fetching the file if missing
+def load_agency_map(file_path):
+    load_json(file_path) # ensures the file exists (and warms the json cache)
+    return _agency_map_cached(file_path, os.path.getmtime(file_path))
+
 # Analyzses an agency's relevant title chapters for word count, complexity, and its checksum
 # Params:
 #   DATA_FOLDER (str) path to the folder where xml and json files are stored
@@ -134,69 +309,167 @@ def build_agency_title_map(agencies_data):
 #    },
 #   ...
 #}
+# Content hash of a file on disk, streamed in 1 MB chunks. Memoized by (path, mtime, size) so
+# an unchanged file is only ever read once per process
+@lru_cache(maxsize=256)
+def _file_sha_cached(file_path, mtime, size):
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+def _file_sha(file_path):
+    stat = os.stat(file_path)
+    return _file_sha_cached(file_path, stat.st_mtime, stat.st_size)
+
+# Opens (creating if needed) the sqlite cache of per-title stats. Rows are keyed by the xml
+# file's content hash plus the chapter selection, so a title whose file is byte-identical
+# across dates — the common case for year-over-year deltas — is parsed and scored exactly once
+def _metrics_db(DATA_FOLDER):
+    db = sqlite3.connect(os.path.join(DATA_FOLDER, "metrics_cache.db"))
+    db.execute(
+        "CREATE TABLE IF NOT EXISTS title_metrics ("
+        " file_sha TEXT, chapters TEXT, word_count INTEGER, n_words INTEGER,"
+        " n_sentences INTEGER, n_syllables INTEGER, sampled INTEGER, text_sha TEXT,"
+        " PRIMARY KEY (file_sha, chapters))"
+    )
+    return db
+
+# Fetches (if missing) and parses a single title for an agency, returning its stat block from
+# the sqlite cache when the file+chapter combination has been scored before. Worker for the
+# per-title pool in analyze_agencies so titles can be downloaded and parsed concurrently
+# Returns (title_num, stats) where stats is None if the fetch failed or nothing matched
+def _analyze_one_title(DATA_FOLDER, title_num, date, info):
+    xml_file = _title_xml_path(DATA_FOLDER, title_num, date)
+
+    # Download xml file if it is missing
+    if not os.path.exists(xml_file):
+        print(f"XML not found locally. Fetching from eCFR for title {title_num}...")
+        success = fetch_full_title_xml(date, title_num)
+        # Skip if fetch fails
+        if not success:
+            print(f"    Skipping Title {title_num} due to fetch failure.")
+            return title_num, None
+        xml_file = _title_xml_path(DATA_FOLDER, title_num, date)
+
+    print(f"  Analyzing title {title_num}")
+
+    # Get relevant chapters for this title from the prebuilt index
+    relevant_chapters = info["chapters_by_title"].get(title_num, [])
+    print(f"    Relevant chapters: {relevant_chapters}") #debug
+
+    if not relevant_chapters:
+        relevant_chapters = None
+        print("    No chapters specified or missing chapter info, parsing entire title") #debug
+
+    # Check the metrics cache before touching the xml at all
+    file_sha = _file_sha(xml_file)
+    chapters_key = ",".join(sorted(c.upper() for c in relevant_chapters)) if relevant_chapters else "*"
+    db = _metrics_db(DATA_FOLDER)
+    try:
+        row = db.execute(
+            "SELECT word_count, n_words, n_sentences, n_syllables, sampled, text_sha"
+            " FROM title_metrics WHERE file_sha = ? AND chapters = ?",
+            (file_sha, chapters_key)
+        ).fetchone()
+        if row:
+            print(f"    Metrics for title {title_num} served from cache") #debug
+            return title_num, {
+                "word_count": row[0],
+                "n_words": row[1],
+                "n_sentences": row[2],
+                "n_syllables": row[3],
+                "sampled": bool(row[4]),
+                "text_sha": row[5]
+            }
+
+        text = " ".join(parse_title_xml(xml_file, target_chapters=relevant_chapters).values())
+        print(f"    Extracted text length: {len(text)}") #debug
+        if not text.strip():
+            return title_num, None
+
+        stats = compute_title_stats(text)
+        db.execute(
+            "INSERT OR REPLACE INTO title_metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (file_sha, chapters_key, stats["word_count"], stats["n_words"],
+             stats["n_sentences"], stats["n_syllables"], int(stats["sampled"]), stats["text_sha"])
+        )
+        db.commit()
+        return title_num, stats
+    finally:
+        db.close()
+
 def analyze_agencies(DATA_FOLDER, date, agency_filter=None):
-    agencies_data = load_json(os.path.join(DATA_FOLDER, "agencies.json"))
-    #print(json.dumps(agencies_data)) #debug
-    agency_map = build_agency_title_map(agencies_data)
+    agency_map = load_agency_map(os.path.join(DATA_FOLDER, "agencies.json"))
     #print(json.dumps(agency_map)) #debug
     results = {}
 
     for agency_id, info in agency_map.items():
         # Skip unrelated agencies if agency filter
         if agency_filter and agency_id != agency_filter:
-            continue  
+            continue
 
         print(f"\nAnalyzing agency: {agency_id}") #debug
-        combined_text = ""
-        total_word_count = 0
+        title_stats = []
         analyzed_titles = []
 
-        for title_num in info["titles"]:
-            xml_file = os.path.join(DATA_FOLDER, f"title_{title_num}_{date}.xml")
-
-            # Download xml file if it is missing
-            if not os.path.exists(xml_file):
-                print(f"XML not found locally. Fetching from eCFR for title {title_num}...")
-                success = fetch_full_title_xml(date, title_num)
-                # Skip if fetch fails
-                if not success:
-                    print(f"    Skipping Title {title_num} due to fetch failure.")
-                    continue
-
-            print(f"  Analyzing title {title_num}")
-    
-            # Get relevant chapters for this title
-            relevant_chapters = [
-                cref.get("chapter")
-                for agency in agencies_data["agencies"]
-                if (agency.get("display_name") or agency.get("name")) == agency_id
-                for cref in agency.get("cfr_references", [])
-                if cref.get("title") == title_num and cref.get("chapter") is not None
+        # Batch-download any missing titles up front so no parse worker stalls on the network.
+        # info["titles"] can repeat a title (one entry per cfr_reference), so dedupe the batch
+        missing = list(dict.fromkeys(
+            title_num for title_num in info["titles"]
+            if not os.path.exists(_title_xml_path(DATA_FOLDER, title_num, date))
+        ))
+        if missing:
+            print(f"  Fetching {len(missing)} missing title(s) from eCFR: {missing}")
+            fetch_titles(date, missing)
+
+        # Fetch + parse every title concurrently (the http downloads and lxml/file IO all release
+        # the GIL), then fold the results back together in title order
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(_analyze_one_title, DATA_FOLDER, title_num, date, info)
+                for title_num in info["titles"]
             ]
-            print(f"    Relevant chapters: {relevant_chapters}") #debug
+            for future in futures:
+                title_num, stats = future.result()
 
-            if not relevant_chapters or any(chap is None for chap in relevant_chapters):
-                relevant_chapters = None
-                print("    No chapters specified or missing chapter info, parsing entire title") #debug
-
-            text = parse_title_xml(xml_file, target_chapters=relevant_chapters)
-            print(f"    Extracted text length: {len(text)}") #debug
-
-            if text.strip():
-                total_word_count += compute_word_count(text)
-                combined_text += " " + text
-                analyzed_titles.append(title_num)
-            else:
-                print(f"    No relevant text found for title {title_num}") #debug
+                if stats is not None:
+                    title_stats.append(stats)
+                    analyzed_titles.append(title_num)
+                else:
+                    print(f"    No relevant text found for title {title_num}") #debug
 
         # Build dict
-        if combined_text.strip():
+        if title_stats:
             #print(f"Data found for {agency_id}") #debug
+            # The agency checksum chains the per-title text hashes in order, so it still
+            # changes iff any title's text changes — without needing the cached text itself
+            hasher = hashlib.sha256()
+            n_words = 0
+            n_sentences = 0
+            n_syllables = 0
+            sampled = False
+            for stats in title_stats:
+                hasher.update(stats["text_sha"].encode("ascii"))
+                n_words += stats["n_words"]
+                n_sentences += stats["n_sentences"]
+                n_syllables += stats["n_syllables"]
+                sampled = sampled or stats["sampled"]
+
+            if n_words:
+                complexity = round(
+                    0.39 * (n_words / max(1, n_sentences)) + 11.8 * (n_syllables / n_words) - 15.59, 2
+                )
+            else:
+                complexity = None
+
             results[agency_id] = {
                 "agency_name": info["name"],
-                "word_count": total_word_count,
-                "checksum": compute_checksum(combined_text),
-                "complexity": compute_complexity(combined_text),
+                "word_count": sum(stats["word_count"] for stats in title_stats),
+                "checksum": hasher.hexdigest(),
+                "complexity": complexity,
+                "complexity_method": "sampled_200kb" if sampled else "full",
                 "titles_count": len(analyzed_titles),
                 "titles analyzed": analyzed_titles
             }
@@ -212,8 +485,7 @@ def analyze_agencies(DATA_FOLDER, date, agency_filter=None):
 #   agency_name (str) name of the agency to extract chapters for
 #   date (str) The date "YYYY-MM-DD" used to identify which xml documents to analyze
 def extract_relevant_text_for_agency(DATA_FOLDER, agency_name, date):
-    agencies_data = load_json(os.path.join(DATA_FOLDER, "agencies.json"))
-    agency_map = build_agency_title_map(agencies_data)
+    agency_map = load_agency_map(os.path.join(DATA_FOLDER, "agencies.json"))
     info = agency_map[agency_name]
     sections = {}
 
@@ -222,29 +494,28 @@ def extract_relevant_text_for_agency(DATA_FOLDER, agency_name, date):
         return sections #as {}
 
     for title_num in info["titles"]:
-        xml_file = os.path.join(DATA_FOLDER, f"title_{title_num}_{date}.xml")
+        xml_file = _title_xml_path(DATA_FOLDER, title_num, date)
         if not os.path.exists(xml_file):
             print(f"    XML not found locally. Fetching from eCFR for title {title_num}...") #debug
             fetch_full_title_xml(date, title_num)
+            xml_file = _title_xml_path(DATA_FOLDER, title_num, date)
 
         if os.path.exists(xml_file):
 
-            relevant_chapters = [
-                cref.get("chapter")
-                for agency in agencies_data["agencies"]
-                if (agency.get("display_name") or agency.get("name")) == agency_name
-                for cref in agency.get("cfr_references", [])
-                if cref.get("title") == title_num and cref.get("chapter") is not None
-            ]
+            relevant_chapters = info["chapters_by_title"].get(title_num, [])
 
-            if not relevant_chapters or any(chap is None for chap in relevant_chapters):
+            if not relevant_chapters:
                 relevant_chapters = None
 
             # use dict from parse_title_xml
-            chapter_text = parse_title_xml(xml_file, target_chapters=relevant_chapters, return_sections=True)
+            chapter_text = parse_title_xml(xml_file, target_chapters=relevant_chapters)
             for heading, text in chapter_text.items():
-                if text.strip():
-                    sections[heading] = text
+                # isspace() is O(1) in the common case, unlike strip() which copies the whole
+                # chapter just to test emptiness
+                if text and not text.isspace():
+                    # Key on title + heading so identical headings in different titles
+                    # don't silently overwrite each other
+                    sections[f"Title {title_num} — {heading}"] = text
 
     return sections
 
@@ -274,10 +545,50 @@ def extract_relevant_text_for_agency(DATA_FOLDER, agency_name, date):
 #  },
 #   ...
 #}
+_METRICS_COLUMNS = ["agency", "date", "word_count", "checksum", "complexity"]
+
+# Loads the precomputed per-(agency, date) metrics table, or an empty frame if none exists yet
+def _load_metrics_table(DATA_FOLDER):
+    path = os.path.join(DATA_FOLDER, "metrics.parquet")
+    if os.path.exists(path):
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            print(f"    Could not read {path}: {e}") #debug
+    return pd.DataFrame(columns=_METRICS_COLUMNS)
+
+# Appends freshly computed (agency, date) rows to the metrics table so the next historical
+# query for the same combo is a dataframe lookup instead of a full re-analysis
+def _append_metrics(DATA_FOLDER, rows):
+    if not rows:
+        return
+    path = os.path.join(DATA_FOLDER, "metrics.parquet")
+    table = pd.concat([_load_metrics_table(DATA_FOLDER), pd.DataFrame(rows)], ignore_index=True)
+    table = table.drop_duplicates(subset=["agency", "date"], keep="last")
+    try:
+        table.to_parquet(path, index=False)
+    except Exception as e:
+        print(f"    Could not write {path}: {e}") #debug
+
 def analyze_agencies_over_time(DATA_FOLDER, dates, agency_filter=None):
     history = {}  # {agency: {date: metrics}}
+    table = _load_metrics_table(DATA_FOLDER)
+    new_rows = []
 
     for date in dates:
+        # Serve from the precomputed table when this exact (agency, date) has been seen before
+        if agency_filter:
+            hit = table[(table["agency"] == agency_filter) & (table["date"] == date)]
+            if not hit.empty:
+                row = hit.iloc[-1]
+                history.setdefault(agency_filter, {})[date] = {
+                    "word_count": int(row["word_count"]),
+                    "checksum": row["checksum"],
+                    "complexity": None if pd.isna(row["complexity"]) else float(row["complexity"])
+                }
+                continue
+
+        # Cache miss (or no filter): analyze live and remember the result for next time
         agency_metrics = analyze_agencies(DATA_FOLDER, date, agency_filter=agency_filter)
         for agency, metrics in agency_metrics.items():
             if agency not in history:
@@ -287,6 +598,15 @@ def analyze_agencies_over_time(DATA_FOLDER, dates, agency_filter=None):
                 "checksum": metrics["checksum"],
                 "complexity": metrics["complexity"]
             }
+            new_rows.append({
+                "agency": agency,
+                "date": date,
+                "word_count": metrics["word_count"],
+                "checksum": metrics["checksum"],
+                "complexity": metrics["complexity"]
+            })
+
+    _append_metrics(DATA_FOLDER, new_rows)
 
     # Add deltas if two dates are given
     if len(dates) == 2:
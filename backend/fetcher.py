@@ -1,7 +1,38 @@
 # Makes all calls to to download the current eCFR data and stores it
 import requests
+import asyncio
+import httpx
+import email.utils
 import os
 import json
+import tempfile
+
+# orjson serializes faster than stdlib json; fall back silently if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# eCFR xml compresses ~10x, so store it zstd-compressed when the codec is available and
+# fall back to plain .xml files otherwise
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+# Preferred on-disk name for a title xml download
+def _title_xml_target(date, title_number):
+    base = f"backend/data/title_{title_number}_{date}.xml"
+    return base + ".zst" if zstd is not None else base
+
+# Writes data to path as indented json, with orjson when available
+def _write_json(path, data):
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
 
 # Downloads agencies data
 def fetch_agencies():
@@ -10,8 +41,7 @@ def fetch_agencies():
     resp.raise_for_status()
     data = resp.json()
     os.makedirs("backend/data", exist_ok=True)
-    with open("backend/data/agencies.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _write_json("backend/data/agencies.json", data)
     print("Agencies data saved.")
 
 # Downloads title data
@@ -21,21 +51,96 @@ def fetch_titles_summary():
     resp.raise_for_status()
     data = resp.json()
     os.makedirs("backend/data", exist_ok=True)
-    with open("backend/data/titles_summary.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _write_json("backend/data/titles_summary.json", data)
     print("Titles summary saved.")
 
-# Downloads full xml documents
+# Downloads full xml documents. If a local copy exists the request is a conditional GET keyed
+# on its mtime, so an unchanged file costs one 304 round trip instead of a 10-100 MB download.
+# The body streams to a .part file that is renamed into place only when complete
 def fetch_full_title_xml(date: str, title_number: int) -> bool:
     url = f"https://www.ecfr.gov/api/versioner/v1/full/{date}/title-{title_number}.xml"
-    response = requests.get(url)
+    os.makedirs("backend/data", exist_ok=True)
+    fname = _title_xml_target(date, title_number)
+
+    headers = {}
+    if os.path.exists(fname):
+        headers["If-Modified-Since"] = email.utils.formatdate(os.path.getmtime(fname), usegmt=True)
+
+    response = requests.get(url, headers=headers, stream=True)
+    if response.status_code == 304:
+        print(f"Title {title_number} unchanged on server, keeping local copy")
+        return True
     if response.status_code == 200:
-        os.makedirs("backend/data", exist_ok=True)
-        fname = f"backend/data/title_{title_number}_{date}.xml"
-        with open(fname, "wb") as f:
-            f.write(response.content)
+        # Unique temp file per download: concurrent requests can fetch the same title at the
+        # same time (e.g. the historical and sections endpoints analyzing one date in
+        # parallel), and they must not truncate or rename away each other's work
+        fd, part = tempfile.mkstemp(dir="backend/data", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if zstd is not None:
+                    compressor = zstd.ZstdCompressor(level=10).compressobj()
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(compressor.compress(chunk))
+                    f.write(compressor.flush())
+                else:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+            os.replace(part, fname)
+        finally:
+            if os.path.exists(part):
+                os.remove(part)
         print(f"Downloaded XML for Title {title_number} on {date}")
-    else:
-        print(f"    Failed to download Title {title_number} XML: {response.status_code}")
-        return False
-    return True
\ No newline at end of file
+        return True
+    print(f"    Failed to download Title {title_number} XML: {response.status_code}")
+    return False
+
+# Downloads several full xml documents concurrently so a batch of N titles takes roughly one
+# round trip instead of N. At most 8 downloads are in flight at once; each one streams to a
+# .part file and is renamed into place only when complete so a failed download leaves nothing
+# half-written. Returns a dict of title_number -> success bool
+async def fetch_titles_async(date: str, title_numbers) -> dict:
+    os.makedirs("backend/data", exist_ok=True)
+    semaphore = asyncio.Semaphore(8)
+    # Dedupe while keeping order: agencies can reference the same title through several
+    # cfr_references, and downloading it twice at once is pure waste
+    title_numbers = list(dict.fromkeys(title_numbers))
+
+    async def fetch_one(client, title_number):
+        url = f"https://www.ecfr.gov/api/versioner/v1/full/{date}/title-{title_number}.xml"
+        fname = _title_xml_target(date, title_number)
+        async with semaphore:
+            try:
+                async with client.stream("GET", url) as response:
+                    if response.status_code != 200:
+                        print(f"    Failed to download Title {title_number} XML: {response.status_code}")
+                        return title_number, False
+                    # Unique temp file per download so concurrent fetches of the same title
+                    # can never truncate or rename away each other's work
+                    fd, part = tempfile.mkstemp(dir="backend/data", suffix=".part")
+                    try:
+                        with os.fdopen(fd, "wb") as f:
+                            if zstd is not None:
+                                compressor = zstd.ZstdCompressor(level=10).compressobj()
+                                async for chunk in response.aiter_bytes(1 << 20):
+                                    f.write(compressor.compress(chunk))
+                                f.write(compressor.flush())
+                            else:
+                                async for chunk in response.aiter_bytes(1 << 20):
+                                    f.write(chunk)
+                        os.replace(part, fname)
+                    finally:
+                        if os.path.exists(part):
+                            os.remove(part)
+                print(f"Downloaded XML for Title {title_number} on {date}")
+                return title_number, True
+            except httpx.HTTPError as e:
+                print(f"    Failed to download Title {title_number} XML: {e}")
+                return title_number, False
+
+    async with httpx.AsyncClient(timeout=60) as client:
+        results = await asyncio.gather(*(fetch_one(client, n) for n in title_numbers))
+    return dict(results)
+
+# Sync wrapper around fetch_titles_async for callers that are not running an event loop
+def fetch_titles(date: str, title_numbers) -> dict:
+    return asyncio.run(fetch_titles_async(date, title_numbers))
\ No newline at end of file
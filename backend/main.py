@@ -1,6 +1,8 @@
 # Provides api endpoints to retrieve stored data
+import os
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from functools import lru_cache
 from typing import Optional
 
 from backend.analyzer import analyze_agencies, analyze_agencies_over_time, extract_relevant_text_for_agency, load_json
@@ -9,6 +11,18 @@ app = FastAPI()
 DATA_FOLDER = "backend/data"
 DEFAULT_DATE = "2024-07-01"
 
+# In-process cache over whole analyses so the per-metric endpoints (and repeat calls for the
+# same date/agency) share one analyze_agencies run. Keyed by agencies.json's mtime so a data
+# refresh invalidates automatically
+@lru_cache(maxsize=32)
+def _analyze_cached(date, agency, agencies_mtime):
+    return analyze_agencies(DATA_FOLDER, date, agency_filter=agency)
+
+def _cached_analysis(date, agency):
+    agencies_file = f"{DATA_FOLDER}/agencies.json"
+    mtime = os.path.getmtime(agencies_file) if os.path.exists(agencies_file) else 0
+    return _analyze_cached(date, agency, mtime)
+
 #needed so that my streamlit app can use a different port
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
@@ -48,6 +62,16 @@ def historical(
     print(f"Returning: {history}")
     return history
 
+# Return every metric for a given agency on a single date in one call, so dashboards that
+# show word count, checksum, and complexity together trigger one analysis instead of three.
+# `GET /api/metrics?agency=A&date=YYYY-MM-DD`
+@app.get("/api/metrics")
+def metrics(
+    date: Optional[str] = Query(DEFAULT_DATE),
+    agency: Optional[str] = Query(None)
+):
+    return _cached_analysis(date, agency)
+
 # Return wordcount metrics for a given agency on a single date.
 # `GET /api/wordcount?agency=A&date=YYYY-MM-DD`
 @app.get("/api/wordcount")
@@ -55,7 +79,7 @@ def wordcount(
     date: Optional[str] = Query(DEFAULT_DATE),
     agency: Optional[str] = Query(None)
 ):
-    results = analyze_agencies(DATA_FOLDER, date, agency_filter=agency)
+    results = _cached_analysis(date, agency)
     return {name: info["word_count"] for name, info in results.items()}
 
 # Return checksum for a given agency on a single date.
@@ -65,7 +89,7 @@ def checksums(
     date: Optional[str] = Query(DEFAULT_DATE),
     agency: Optional[str] = Query(None)
 ):
-    results = analyze_agencies(DATA_FOLDER, date, agency_filter=agency)
+    results = _cached_analysis(date, agency)
     return {name: info["checksum"] for name, info in results.items()}
 
 # Return complexity metrics for a given agency on a single date.
@@ -75,5 +99,5 @@ def complexity(
     date: Optional[str] = Query(DEFAULT_DATE),
     agency: Optional[str] = Query(None)
 ):
-    results = analyze_agencies(DATA_FOLDER, date, agency_filter=agency)
+    results = _cached_analysis(date, agency)
     return {name: info["complexity"] for name, info in results.items()}
\ No newline at end of file
@@ -1,15 +1,33 @@
 # Frontend Streamlit display for users
 import sys
 import os
+import asyncio
 import streamlit as st
-import requests
+import httpx
 import pandas as pd
 # force the parent directory of this file to be on the module search path because it could not find the backend folder
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from backend.fetcher import fetch_full_title_xml
+from backend.fetcher import fetch_titles
 
 st.title("Federal Regulation Analyzer")
 
+BACKEND_URL = "http://localhost:8000"
+
+# One keep-alive connection pool reused across Streamlit reruns instead of a fresh TCP
+# connection per request
+@st.cache_resource
+def get_client():
+    return httpx.Client(base_url=BACKEND_URL, timeout=120)
+
+# Fires the historical and sections requests concurrently so the Analyze click waits for the
+# slower of the two backend calls instead of their sum
+async def _fetch_analysis(params, sections_params):
+    async with httpx.AsyncClient(base_url=BACKEND_URL, timeout=120) as client:
+        return await asyncio.gather(
+            client.get("/api/historical", params=params),
+            client.get("/api/agency_sections", params=sections_params),
+        )
+
 ## Download the XML files from eCFR
 st.header("Download eCFR XML Files")
 
@@ -33,15 +51,10 @@ if download_button:
             download_dir = "../backend/data"
             os.makedirs(download_dir, exist_ok=True)
 
-            successes = []
-            failures = []
-
-            for title in selected_titles:
-                success = fetch_full_title_xml(date, title)
-                if success:
-                    successes.append(title)
-                else:
-                    failures.append(title)
+            # All selected titles download concurrently
+            results = fetch_titles(date, selected_titles)
+            successes = [title for title, ok in results.items() if ok]
+            failures = [title for title, ok in results.items() if not ok]
 
             if successes:
                 st.success(f"Downloaded {len(successes)} XML file(s): {successes}")
@@ -54,10 +67,10 @@ st.header("Analyze Titles Per Agency")
 @st.cache_data
 def fetch_agencies():
     try:
-        response = requests.get("http://localhost:8000/api/agencies")
+        response = get_client().get("/api/agencies")
         response.raise_for_status()
         return response.json()
-    except requests.RequestException:
+    except httpx.HTTPError:
         return []
 
 agencies = fetch_agencies()
@@ -87,9 +100,11 @@ if st.button("Analyze"):
                 "agency": selected_agency,
                 "dates": [start_date.isoformat(), end_date.isoformat()]
             }
+            sections_params = {"agency": selected_agency, "date": end_date.isoformat()}
 
             #st.write(params) #raw params for debug
-            response = requests.get("http://localhost:8000/api/historical", params=params)
+            # Both backend calls run concurrently
+            response, sections_response = asyncio.run(_fetch_analysis(params, sections_params))
             response.raise_for_status()
             data = response.json()
 
@@ -117,11 +132,7 @@ if st.button("Analyze"):
                         "Complexity Change": delta["complexity_change"]
                     })
 
-                # Fetch and display relevant chapter sections for the latest date
-                sections_url = "http://localhost:8000/api/agency_sections"
-                sections_params = {"agency": selected_agency, "date": end_date.isoformat()}
-
-                sections_response = requests.get(sections_url, params=sections_params)
+                # Display relevant chapter sections for the latest date (fetched above)
                 sections_response.raise_for_status()
                 sections_data = sections_response.json()
 
@@ -139,5 +150,5 @@ if st.button("Analyze"):
             else:
                 st.warning("No data available for selected agency and dates.")
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             st.error(f"Failed to load data: {e}")